@@ -5,22 +5,33 @@ This module provides utility functions for downloading historical data, reading
 """
 
 import os
-import random
 import csv
 import json
-from typing import Dict, Optional, Tuple
+from typing import Dict, NamedTuple, Optional
 import pytz
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from tvDatafeed import TvDatafeed, Interval
 import numpy as np
+import pandas as pd
 import config
-from typing import TypeAlias
 from numpy.typing import NDArray
 from types import ModuleType
 
 
-DataTuple: TypeAlias = Tuple[str, NDArray, NDArray, NDArray, NDArray, NDArray, NDArray, NDArray]
+class DataTuple(NamedTuple):
+    """Historical data of a symbol, one array per column. Unpacks positionally like a plain tuple.
+    
+    dates are datetime64[D] and times are the time of day as timedelta64[s].
+    """
+    symbol: str
+    dates: NDArray
+    times: NDArray
+    opens: NDArray
+    highs: NDArray
+    lows: NDArray
+    closes: NDArray
+    volume: NDArray
 
 INTERVAL_MAP = {
     "1": Interval.in_1_minute,
@@ -60,21 +71,25 @@ def get_strategy(strategy: str) -> ModuleType:
         raise e
 
 
-def slippage(number: float) -> float:
-    """Add random slippage to a number, simulating real-world market slippage. Slippage is a random number between -0.05 and 0.05."""
-    return number + random.uniform(-0.05, 0.05)
+def slippage(number: float | NDArray) -> float | NDArray:
+    """Add random slippage to a number, simulating real-world market slippage. Slippage is a random number between -0.05 and 0.05.
+    
+    Pass an array of prices to draw all their slippages in one batched call.
+    """
+    return number + np.random.uniform(-0.05, 0.05, size=np.shape(number))
 
 def read_from_csv(symbol: str, path: str) -> DataTuple:
-    """Read CSV into NumPy arrays."""
-    data = np.genfromtxt(f'{path+symbol}.csv', delimiter=',', dtype=None, names=True, encoding='utf-8')
-    dates = np.array([datetime.strptime(d, '%Y-%m-%d').date() for d in data['date']])
-    times = np.array([datetime.strptime(t, '%H:%M:%S').time() for t in data['time']])
-    opens = data['Open']
-    highs = data['High']
-    lows = data['Low']
-    closes = data['Close']
-    volume = data['Volume']
-    return symbol, dates, times, opens, highs, lows, closes, volume
+    """Read CSV into contiguous NumPy arrays, one per column. Prices and volume are float64, dates and times are parsed in C rather than row by row."""
+    df = pd.read_csv(f'{path+symbol}.csv', dtype={'date': str, 'time': str, 'Open': np.float64, 'High': np.float64, 'Low': np.float64, 'Close': np.float64, 'Volume': np.float64})
+    timestamps = np.asarray(df['date'] + 'T' + df['time'], dtype='datetime64[s]')
+    dates = timestamps.astype('datetime64[D]')
+    times = timestamps - dates
+    opens = np.ascontiguousarray(df['Open'].to_numpy(), dtype=np.float64)
+    highs = np.ascontiguousarray(df['High'].to_numpy(), dtype=np.float64)
+    lows = np.ascontiguousarray(df['Low'].to_numpy(), dtype=np.float64)
+    closes = np.ascontiguousarray(df['Close'].to_numpy(), dtype=np.float64)
+    volume = np.ascontiguousarray(df['Volume'].to_numpy(), dtype=np.float64)
+    return DataTuple(symbol, dates, times, opens, highs, lows, closes, volume)
 
 def read_column_from_csv(filename: str, column_name: str) -> list[str]:
     """Read a specific column from a CSV file."""
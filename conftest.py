@@ -0,0 +1 @@
+# Marks the repo root as pytest's rootdir so plain `pytest` can import the top-level packages (indicators, strategies, ...)
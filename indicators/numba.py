@@ -1,10 +1,40 @@
 import numpy as np
-from numba import njit
-
-@njit
-def calculate_ema(data: np.ndarray, period: int) -> np.ndarray:
+from numba import njit, types
+from numba.extending import overload
+
+@njit(cache=True)
+def _memory_span(a: np.ndarray) -> tuple:
+    start = a.ctypes.data
+    end = start + (a.shape[0] - 1) * a.strides[0]
+    if end < start:  # negative stride
+        start, end = end, start
+    return start, end + a.itemsize
+
+def _out_buffer(data, out, dtype):
+    pass
+
+@overload(_out_buffer)
+def _out_buffer_impl(data, out, dtype):
+    # Output buffer for kernels taking an optional out=: resolved per argument type at compile time, so out may be
+    # any float dtype (e.g. float32 for FP32 results). Omitted, a fresh array of the kernel's default dtype is
+    # allocated. Given, out must have the same length as data and must not share memory with it (no in-place use).
+    if isinstance(out, (types.NoneType, types.Omitted)):
+        return lambda data, out, dtype: np.empty(data.shape[0], dtype)
+
+    def impl(data, out, dtype):
+        if out.shape[0] != data.shape[0]:
+            raise ValueError("out must have the same length as data")
+        data_start, data_end = _memory_span(data)
+        out_start, out_end = _memory_span(out)
+        if out_start < data_end and data_start < out_end:
+            raise ValueError("out must not share memory with data")
+        return out  # caller-provided buffer, reused across parameter sweeps
+    return impl
+
+@njit(cache=True)
+def calculate_ema(data: np.ndarray, period: int, out: np.ndarray | None = None) -> np.ndarray:
     alpha = 2 / (period + 1)
-    ema = np.empty_like(data)
+    ema = _out_buffer(data, out, data.dtype)
     ema[0] = data[0]  # seed with first price
     
     for i in range(1, data.shape[0]):
@@ -12,7 +42,7 @@ def calculate_ema(data: np.ndarray, period: int) -> np.ndarray:
     
     return ema
 
-@njit
+@njit(cache=True)
 def calculate_macd_histogram(prices, fast=12, slow=26, signal=9):
     ema_fast = calculate_ema(prices, fast)
     ema_slow = calculate_ema(prices, slow)
@@ -20,7 +50,7 @@ def calculate_macd_histogram(prices, fast=12, slow=26, signal=9):
     signal_line = calculate_ema(macd_line, signal)
     return macd_line - signal_line  # Histogram
 
-@njit
+@njit(cache=True)
 def calculate_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int=14) -> np.ndarray:
     atr = np.empty_like(close)
     tr = np.empty_like(close)
@@ -43,7 +73,7 @@ def calculate_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period:
     
     return atr
 
-@njit
+@njit(cache=True)
 def calculate_supertrend(high, low, close, period=10, multiplier=3.0):
     n = len(close)
     
@@ -82,7 +112,7 @@ def calculate_supertrend(high, low, close, period=10, multiplier=3.0):
 
     return trend  # 1 for uptrend, -1 for downtrend
 
-@njit
+@njit(cache=True)
 def calculate_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
     deltas = np.diff(prices)
     gains = np.maximum(deltas, 0)
@@ -101,7 +131,7 @@ def calculate_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
     rs = avg_gain / (avg_loss + 1e-10)  # Avoid division by zero
     return 100 - (100 / (1 + rs))
 
-@njit
+@njit(cache=True)
 def calculate_adx(high, low, close, period=14):
     n = len(close)
     plus_dm = np.zeros(n)
@@ -152,7 +182,7 @@ def calculate_adx(high, low, close, period=14):
 
     return adx  # ADX values: higher = stronger trend
 
-@njit
+@njit(cache=True)
 def calculate_vwap(high, low, close, volume):
     n = len(close)
     vwap = np.empty(n)
@@ -167,10 +197,10 @@ def calculate_vwap(high, low, close, volume):
 
     return vwap
 
-@njit
-def calculate_sma(data: np.ndarray, period: int) -> np.ndarray:
+@njit(cache=True)
+def calculate_sma(data: np.ndarray, period: int, out: np.ndarray | None = None) -> np.ndarray:
     n = data.shape[0]
-    sma = np.empty(n)
+    sma = _out_buffer(data, out, np.float64)
     sma[:period-1] = np.nan
 
     window_sum = 0.0
@@ -184,7 +214,7 @@ def calculate_sma(data: np.ndarray, period: int) -> np.ndarray:
 
     return sma
 
-@njit
+@njit(cache=True)
 def calculate_ema_slope_simple(ema_values: np.ndarray, lookback: int = 10) -> np.ndarray:
     n = len(ema_values)
     slopes = np.empty(n)
@@ -197,7 +227,7 @@ def calculate_ema_slope_simple(ema_values: np.ndarray, lookback: int = 10) -> np
 
     return slopes
 
-@njit
+@njit(cache=True)
 def calculate_ema_slope_linreg(ema_values: np.ndarray, lookback: int = 10) -> np.ndarray:
     n = len(ema_values)
     slopes = np.empty(n)
@@ -218,7 +248,7 @@ def calculate_ema_slope_linreg(ema_values: np.ndarray, lookback: int = 10) -> np
 
     return slopes
 
-@njit
+@njit(cache=True)
 def calculate_ema_slope(ema_values: np.ndarray, lookback: int=10, method: str='simple') -> np.ndarray:
     match method:
         case 'simple':
@@ -228,7 +258,7 @@ def calculate_ema_slope(ema_values: np.ndarray, lookback: int=10, method: str='s
         case _:
             raise ValueError("Invalid method. Use 'simple' or 'linreg'.")
 
-@njit
+@njit(cache=True)
 def daily_rolling_median_atr(atr: np.ndarray, candles_per_day: int = 75, window_days: int = 30) -> np.ndarray:
     n_candles = len(atr)
     n_days = n_candles // candles_per_day
@@ -5,14 +5,14 @@ import numpy as np
 RISK_FREE_RATE = 0.07 # Risk free rate for Indian market
 
 # --- Risk Metrics Calculation ---
-@njit
+@njit(cache=True)
 def calculate_sharpe(returns: NDArray, risk_free_rate: float = 0.0, scaling_factor: float = 252.0) -> float:
     excess_returns = returns - risk_free_rate
     if len(excess_returns) < 2 or np.std(excess_returns) == 0:
         return 0.0
     return np.mean(excess_returns) / np.std(excess_returns) * np.sqrt(scaling_factor)
 
-@njit
+@njit(cache=True)
 def calculate_sortino(returns: NDArray, risk_free_rate: float = 0.0, scaling_factor: float = 252.0) -> float:
     excess_returns = returns - risk_free_rate
     downside_returns = excess_returns[excess_returns < 0]
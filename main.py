@@ -77,6 +77,9 @@ def run_backtest(symbols: list, strategy_name: str, interval: str = '5', downloa
     
     print(f"Running {strategy_name} on {len(symbols)} symbols...")
     
+    # Compile (and disk-cache) the strategy kernels once here so pool workers don't each recompile them
+    StrategyClass.precompile(data_list[0], **kwargs)
+    
     execution_results = []
     run_with_kwargs = partial(strategy_instance.process, **kwargs)
     
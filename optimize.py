@@ -16,14 +16,14 @@ def walk_forward_split(data: DataTuple, train_size=1500, test_size=200):
     for start in range(0, end, test_size):
         train_end = start+train_size
         test_end = train_end+test_size
-        train = [data[0], *[np.array(d[0:train_end]) for d in data[1:]]]
-        test = [data[0], *[np.array(d[train_end:test_end]) for d in data[1:]]]
+        train = DataTuple(data[0], *[np.array(d[0:train_end]) for d in data[1:]])
+        test = DataTuple(data[0], *[np.array(d[train_end:test_end]) for d in data[1:]])
         yield train, test
 
 def get_data_split(data: DataTuple, split=0.3):
     start = int(len(data[1]) * split)  # percent split
     # Ensure divisible by something sensible if needed, or just take slice
-    return [data[0], *[np.array(d[-start:]) for d in data[1:]]]
+    return DataTuple(data[0], *[np.array(d[-start:]) for d in data[1:]])
 
 def calculate_robust_score(sortino: np.float32, drawdown: np.float32, total_return: np.float32) -> np.float32:
     """Calculate the robust score for a strategy."""
@@ -34,6 +34,7 @@ class StrategyOptimizationProblem:
     def __init__(self, data: DataTuple, strategy_class: Type[Base], bounds: Tuple[List[float], List[float]], param_names: List[str]):
         self.data = data
         self.strategy = strategy_class()
+        self.equity_buffer = np.empty(len(data[1]), dtype=self.strategy.dtype) # Reused by every process() call
         self.bounds = bounds
         self.param_names = param_names
         self.n_obj = 1 # Single objective
@@ -43,6 +44,7 @@ class StrategyOptimizationProblem:
 
     def evaluate(self, params: List[float]) -> Tuple[np.ndarray, np.ndarray, float, int]:
         # returns, equity_curve, win_rate, no_of_trades
+        # equity_curve is a view into self.equity_buffer, valid until the next evaluate call
         kwargs = self.get_params_kwargs(params)
         
         # Check constraints
@@ -50,7 +52,7 @@ class StrategyOptimizationProblem:
             return (np.array([0.0]), np.array([1.0]), 0.0, 0)
             
         try:
-            return self.strategy.process(self.data, **kwargs)
+            return self.strategy.process(self.data, _eq_out=self.equity_buffer, **kwargs)
         except Exception:
             return (np.array([0.0]), np.array([1.0]), 0.0, 0)
 
@@ -58,13 +60,13 @@ class StrategyOptimizationProblem:
         # returns, equity_curve, win_rate, no_of_trades
         returns, _, _, _ = self.evaluate(params)
         
-        # Use Trade-based metrics for optimization stability
-        trades = returns[returns != 0]
-        
         # Penalties
-        if len(trades) < 2: # Too few trades
+        if np.count_nonzero(returns) < 2: # Too few trades
             return [1e6]
             
+        # Use Trade-based metrics for optimization stability
+        trades = returns[returns != 0]
+        
         sharpe = calculate_sharpe(trades) # Trade Sharpe
         sortino = calculate_sortino(trades)
         drawdown = calculate_max_drawdown(returns) # Max DD from equity curve perspective (using full returns)
@@ -126,11 +128,12 @@ def walk_forward_optimize(data: DataTuple, strategy_class: Type[Base], bounds, p
         for params in pareto_x:
             # Re-run to get full metrics
             returns, _, win_pct, _ = test_problem.evaluate(params)
-            trades = returns[returns != 0]
             
-            if len(trades) < 2:
+            if np.count_nonzero(returns) < 2:
                 continue
                 
+            trades = returns[returns != 0]
+            
             sharpe = calculate_sharpe(trades)
             sortino = calculate_sortino(trades)
             drawdown = calculate_max_drawdown(returns)
@@ -194,6 +197,15 @@ def run_optimization(symbol: str, strategy_name: str, interval: str = '5', pop:
     upper_bounds = [b[1] for b in bounds.values()]
     bounds_tuple = (lower_bounds, upper_bounds)
     
+    # Compile (and disk-cache) the strategy and risk-metric kernels once here so archipelago islands don't each recompile them
+    try:
+        StrategyClass.precompile(data)
+        warmup_trades = np.zeros(2, dtype=StrategyClass.dtype)  # same dtype as the trades fitness passes in
+        calculate_sharpe(warmup_trades)
+        calculate_sortino(warmup_trades)
+    except Exception as e:
+        print(f"Warning: precompiling {strategy_name} failed, islands will compile on their own: {e}")
+    
     print("Running Walk-Forward Optimization...")
     wfa_results = walk_forward_optimize(data, StrategyClass, bounds_tuple, param_names, pop=pop, gen=gen)
     
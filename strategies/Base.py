@@ -1,12 +1,33 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
 from numpy.typing import NDArray
+from numba import njit
 import numpy as np
 
+@njit(cache=True)
+def _process_kernel(returns, equity_curve):
+    """Single pass over returns filling equity_curve in place (running product of 1 + r) and counting the winning trades."""
+    n = returns.shape[0]
+    acc = 1.0
+    wins = 0
+    for i in range(n):
+        r = returns[i]
+        acc *= (1.0 + r)
+        equity_curve[i] = acc
+        if r > 0.0:
+            wins += 1
+    return wins
+
 class Base(ABC):
     """Base class for strategies.
+    
+    Attributes:
+        dtype: Floating point type used for returns and the equity curve. Override per strategy if more precision is needed.
+        precompile_bars: Bars used by precompile. Override if the strategy's fixed offsets (warm-up periods etc.) need more.
     """
     
+    dtype = np.float32
+    precompile_bars = 1000
 
     def __init__(self):
         pass
@@ -25,23 +46,40 @@ class Base(ABC):
         """
         return np.array([])
 
-    def process(self, data, **kwargs) -> Tuple[NDArray, NDArray, float, int]:
+    def process(self, data, *, _eq_out: NDArray | None = None, **kwargs) -> Tuple[NDArray, NDArray, float, int]:
         """
         Process the data on user-defined strategy (run method), and calculate returns, equity curve, win rate and number of trades.
         
         Args:
             data (DataTuple): The data to process.
+            _eq_out (np.ndarray, optional): Keyword-only, preallocated buffer for the equity curve, reused when it is large enough and of the same dtype. Defaults to None.
             **kwargs: Strategy parameters.
             
         Returns:
             Tuple[np.ndarray, np.ndarray, float, int]: Tuple containing (returns, equity_curve, win_rate, no_of_trades)
         """
-        returns = self.run(data, **kwargs)
-        total_trades = len(returns)
-        equity_curve = np.cumprod(1 + returns)
-        win_rate = np.sum(returns > 0) / total_trades if total_trades > 0 else 0.0
+        returns = np.asarray(self.run(data, **kwargs), dtype=self.dtype)
+        total_trades = returns.shape[0]
+        if _eq_out is None or _eq_out.shape[0] < total_trades or _eq_out.dtype != returns.dtype:
+            _eq_out = np.empty(total_trades, dtype=returns.dtype)
+        equity_curve = _eq_out[:total_trades]
+        wins = _process_kernel(returns, equity_curve)
+        win_rate = wins / total_trades if total_trades > 0 else 0.0
         return returns, equity_curve, win_rate, total_trades
 
+    @classmethod
+    def precompile(cls, data, **kwargs) -> None:
+        """
+        Run the strategy on the first precompile_bars bars so its Numba kernels are compiled (and cached on disk)
+        before the first timed or parallel run. Compiled code depends on dtypes and layout, not length.
+        
+        Args:
+            data (DataTuple): Data with the same dtypes as the real runs.
+            **kwargs: Strategy parameters.
+        """
+        symbol, *columns = data
+        cls().process(type(data)(symbol, *(col[:cls.precompile_bars] for col in columns)), **kwargs)  # rebuilt as the caller's DataTuple
+
     @abstractmethod
     def validate_params(self, **kwargs) -> bool:
         """
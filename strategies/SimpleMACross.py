@@ -4,16 +4,32 @@ import pandas as pd
 from numba import njit
 from Utilities import DataTuple
 
-@njit
-def fast_numba_strategy(closes, fast_ma_period, slow_ma_period):
+@njit(cache=True)
+def fast_numba_strategy(closes, fast_ma_period, slow_ma_period, emit_signals=True):
     n = len(closes)
     
-    # Calculate MAs (Simple implementation for speed)
-    fast_ma = np.full(n, np.nan)
-    slow_ma = np.full(n, np.nan)
+    # Generate signals (entry/exit markers are only materialised when requested, backtests just need returns)
+    n_signals = n if emit_signals else 0
+    entries = np.zeros(n_signals, dtype=np.int8)
+    exits = np.zeros(n_signals, dtype=np.int8)
+    in_position = False
+    
+    # 0: long, 1: none
     
+    returns = np.zeros(n)
+    
+    # MAs are kept as running sums and the previous bar's values only, no full MA arrays are written
     running_sum_fast = 0.0
     running_sum_slow = 0.0
+    fast_ma = np.nan
+    slow_ma = np.nan
+    prev_fast_ma = np.nan
+    prev_slow_ma = np.nan
+    
+    entry_price = 0.0
+    
+    # Both MAs need a value on the previous bar before a cross can be detected
+    start_idx = max(fast_ma_period, slow_ma_period) + 1
     
     for i in range(n):
         running_sum_fast += closes[i]
@@ -21,41 +37,31 @@ def fast_numba_strategy(closes, fast_ma_period, slow_ma_period):
         
         if i >= fast_ma_period:
             running_sum_fast -= closes[i - fast_ma_period]
-            fast_ma[i] = running_sum_fast / fast_ma_period
+            fast_ma = running_sum_fast / fast_ma_period
             
         if i >= slow_ma_period:
             running_sum_slow -= closes[i - slow_ma_period]
-            slow_ma[i] = running_sum_slow / slow_ma_period
-
-    # Generate signals
-    entries = np.zeros(n)
-    exits = np.zeros(n)
-    in_position = False
-    
-    # 0: long, 1: none
-    
-    returns = np.zeros(n)
-    
-    # Very simple vectorized backtest logic within the loop
-    entry_price = 0.0
-    
-    # We need at least slow_ma_period to have values
-    start_idx = slow_ma_period
-    
-    for i in range(start_idx, n):
-        # Cross Over: Fast crosses above Slow -> Buy
-        if not in_position and fast_ma[i] > slow_ma[i] and fast_ma[i-1] <= slow_ma[i-1]:
-            in_position = True
-            entry_price = closes[i]
-            entries[i] = 1
-            
-        # Cross Under: Fast crosses below Slow -> Sell
-        elif in_position and fast_ma[i] < slow_ma[i] and fast_ma[i-1] >= slow_ma[i-1]:
-            in_position = False
-            exit_price = closes[i]
-            exits[i] = 1
-            ret = (exit_price - entry_price) / entry_price
-            returns[i] = ret
+            slow_ma = running_sum_slow / slow_ma_period
+        
+        if i >= start_idx:
+            # Cross Over: Fast crosses above Slow -> Buy
+            if not in_position and fast_ma > slow_ma and prev_fast_ma <= prev_slow_ma:
+                in_position = True
+                entry_price = closes[i]
+                if emit_signals:
+                    entries[i] = 1
+                
+            # Cross Under: Fast crosses below Slow -> Sell
+            elif in_position and fast_ma < slow_ma and prev_fast_ma >= prev_slow_ma:
+                in_position = False
+                exit_price = closes[i]
+                if emit_signals:
+                    exits[i] = 1
+                ret = (exit_price - entry_price) / entry_price
+                returns[i] = ret
+        
+        prev_fast_ma = fast_ma
+        prev_slow_ma = slow_ma
             
     return returns, entries, exits
 
@@ -68,7 +74,7 @@ class SimpleMACross(Base):
         fast_ma = int(fast_ma)
         slow_ma = int(slow_ma)
         
-        returns, _, _ = fast_numba_strategy(closes, fast_ma, slow_ma)
+        returns, _, _ = fast_numba_strategy(closes, fast_ma, slow_ma, emit_signals=False)
         
         return returns
     
@@ -7,38 +7,37 @@ high_prices = np.random.randint(50, 151, size=100) + np.random.rand(100)
 low_prices = np.random.randint(50, 151, size=100) + np.random.rand(100)
 close_prices = np.random.randint(50, 151, size=100) + np.random.rand(100)
 
-@njit
+@njit(cache=True)
 def numba_atr(high, low, close, period=14):
     n = len(close)
-    tr = np.empty(n)
-    tr[0] = np.nan
+    atr = np.zeros(n)
 
-    for i in range(1, n):
-        tr[i] = max(
+    # SMA seed over the first true ranges (bar 0 has no previous close)
+    tr_sum = 0.0
+    for i in range(1, period):
+        tr_sum += max(
             high[i] - low[i],
             abs(high[i] - close[i - 1]),
             abs(low[i] - close[i - 1])
         )
+    atr[period - 1] = tr_sum / (period - 1)
 
-    atr = np.zeros_like(tr)
-
-    atr[period - 1] = np.nanmean(tr[:period])  # SMA seed
-
+    # Wilder's smoothing, true range computed inline
     alpha = 1.0 / period
-    
-    atr[period] = (1 - alpha) * atr[period - 1]
-    
     for i in range(period, n):
-        atr[i] += alpha * tr[i]
+        tr = max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1])
+        )
+        prev = atr[i - 1]
+        atr[i] = prev + alpha * (tr - prev)
 
     return atr
 
 
-numba_atr_values = numba_atr(high_prices, low_prices, close_prices)
-print("Numba ATR:", numba_atr_values)
-
-# Verify against the original vectorized function (for comparison)
-def vectorized_atr(high, low, close, period=14):
+def wilder_atr(high, low, close, period=14):
+    """Plain Python reference: vectorized true range, then Wilder's recurrence atr[i] = atr[i-1] + (tr[i] - atr[i-1]) / period."""
     tr = np.maximum.reduce([
         high - low,
         np.abs(high - np.roll(close, 1)),
@@ -46,16 +45,20 @@ def vectorized_atr(high, low, close, period=14):
     ])
     tr[0] = np.nan  # First TR is NaN
 
-    # Calculate ATR using EMA (approximates Wilder's smoothing)
     atr = np.zeros_like(tr)
-    atr[period - 1] = np.nanmean(tr[:period])
-    alpha = 1 / period  # EMA smoothing factor
-
-    # Vectorized EMA calculation
-    atr[period:] = (1 - alpha) * atr[period - 1:-1] + alpha * tr[period:]
+    atr[period - 1] = np.nanmean(tr[:period])  # SMA seed
+    for i in range(period, len(tr)):
+        atr[i] = atr[i - 1] + (tr[i] - atr[i - 1]) / period
     return atr
 
-vectorized_atr_values = vectorized_atr(high_prices, low_prices, close_prices)
-print("Vectorized ATR:", vectorized_atr_values)
 
-print("Are the results close?", np.allclose(numba_atr_values, vectorized_atr_values, equal_nan=True))
\ No newline at end of file
+def test_numba_atr_matches_wilder_reference():
+    assert np.allclose(numba_atr(high_prices, low_prices, close_prices), wilder_atr(high_prices, low_prices, close_prices))
+
+
+if __name__ == '__main__':
+    numba_atr_values = numba_atr(high_prices, low_prices, close_prices)
+    wilder_atr_values = wilder_atr(high_prices, low_prices, close_prices)
+    print("Numba ATR:", numba_atr_values)
+    print("Wilder ATR:", wilder_atr_values)
+    print("Are the results close?", np.allclose(numba_atr_values, wilder_atr_values))
@@ -0,0 +1,49 @@
+import os
+import timeit
+import numpy as np
+import pytest
+from indicators.numba import calculate_sma
+
+# Regression checks for calculate_sma: numerical agreement with a NumPy cumsum reference, and an
+# opt-in timing guard (RUN_BENCHMARKS=1) so the Numba kernel never ends up slower than the NumPy version.
+PERIOD = 20
+SIZES = [1_000, 100_000, 1_000_000]
+MAX_RATIO = 1.0  # calculate_sma time / sma_cumsum time
+
+def sma_cumsum(data, period):
+    csum = np.concatenate(([0.0], np.cumsum(data)))
+    sma = np.empty(len(data))
+    sma[:period - 1] = np.nan
+    sma[period - 1:] = (csum[period:] - csum[:-period]) / period
+    return sma
+
+def best_time(func, *args, number=10, repeat=5):
+    """Best average time of a call over several repeats (robust to scheduler noise)."""
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=repeat)) / number
+
+def make_prices(size):
+    return np.random.randint(50, 151, size=size) + np.random.rand(size)
+
+@pytest.mark.parametrize("size", SIZES)
+def test_calculate_sma_matches_cumsum(size):
+    close_prices = make_prices(size)
+    assert np.allclose(calculate_sma(close_prices, PERIOD), sma_cumsum(close_prices, PERIOD), equal_nan=True)
+
+def test_calculate_sma_out_buffer():
+    close_prices = make_prices(1_000)
+    out = np.empty(len(close_prices), dtype=np.float32)
+    assert calculate_sma(close_prices, PERIOD, out) is out
+    assert np.allclose(out, sma_cumsum(close_prices, PERIOD), rtol=1e-5, equal_nan=True)
+
+    for bad_out in (close_prices, np.empty(len(close_prices) - 1)):
+        with pytest.raises(ValueError):
+            calculate_sma(close_prices, PERIOD, bad_out)
+
+@pytest.mark.skipif(not os.environ.get("RUN_BENCHMARKS"), reason="timing test; set RUN_BENCHMARKS=1 to run")
+@pytest.mark.parametrize("size", SIZES)
+def test_calculate_sma_not_slower_than_cumsum(size):
+    close_prices = make_prices(size)
+    calculate_sma(close_prices[:PERIOD * 2], PERIOD)  # warm the JIT so compilation is not timed
+
+    ratio = best_time(calculate_sma, close_prices, PERIOD) / best_time(sma_cumsum, close_prices, PERIOD)
+    assert ratio < MAX_RATIO, f"calculate_sma regressed: {ratio:.2f}x the NumPy reference at n={size}"